@@ -1,72 +1,128 @@
 #!/usr/bin/env python3
+import sys
 import time
-import psutil   # For memory usage (you might need: pip install psutil)
+import tracemalloc   # For memory usage (standard library, no extra install needed)
 from collections import deque
+from itertools import islice
+from operator import itemgetter
 
-def measure_memory():
-    """Returns the memory usage in MB of the current process."""
-    process = psutil.Process()
-    mem_info = process.memory_info()
-    return mem_info.rss / (1024 * 1024)  # Convert bytes to MB
-
-def main():
-    # 1. Read the file listing from text file
-    input_file = "listing.txt"
-    
-    with open(input_file, "r", encoding="utf-8", errors="ignore") as f:
-        lines = [line.strip() for line in f.readlines() if line.strip()]
+try:
+    import resource   # Unix only, used for the peak RSS report
+except ImportError:
+    resource = None
 
-    # Print an overview
-    print(f"Total lines read from file: {len(lines)}")
-
-    # 2. Store content in a hashtable (Python dictionary), stack (list), and queue (deque)
+def measure_memory():
+    """Returns the memory currently allocated by Python, in MB (requires tracemalloc to be started)."""
+    current, _peak = tracemalloc.get_traced_memory()
+    return current / (1024 * 1024)  # Convert bytes to MB
+
+def measure_peak_rss():
+    """Returns the peak resident set size in MB of the current process, or None if unavailable."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == "darwin":
+        return peak / (1024 * 1024)  # macOS reports bytes
+    return peak / 1024  # Linux reports KB
+
+def build_structures(lines, probe, results):
+    """Builds the hashtable, stack and queue, recording (label, probe() before, probe() after) for each build."""
+    # Store content in a hashtable (Python dictionary), stack (list), and queue (deque)
+    # Scalability note: each structure is built in its own pass over 'lines' so it can be measured
+    # separately. If only the populated structures were needed, they could be filled in one fused pass,
+    # but each build below is already a single C-level call, which beats a per-item Python loop.
     # -------------------------------------------------------------------
     # (A) HASHTABLE
     # We'll store each line as a key in a dictionary. 
     # If lines can repeat, you might store them as {line: count}, etc.
-    
-    start_time = time.perf_counter()
-    start_mem = measure_memory()
-    
-    hashtable = {}
-    for i, line in enumerate(lines):
-        hashtable[line] = i  # store index, or anything else
-    
-    end_time = time.perf_counter()
-    end_mem = measure_memory()
-    
-    print(f"Hashtable creation took {(end_time - start_time):.6f} seconds.")
-    print(f"Memory used for hashtable: {end_mem - start_mem:.6f} MB.\n")
+    start = probe()
+    hashtable = dict(zip(lines, range(len(lines))))  # store index, or anything else
+    end = probe()
+    results.append(("Hashtable creation", start, end))
 
     # (B) STACK (using a Python list)
-    
-    start_time = time.perf_counter()
-    start_mem = measure_memory()
-    
-    stack = []
-    for line in lines:
-        stack.append(line)  # push
-    
-    end_time = time.perf_counter()
-    end_mem = measure_memory()
-    
-    print(f"Stack creation (push all) took {(end_time - start_time):.6f} seconds.")
-    print(f"Memory used for stack: {end_mem - start_mem:.6f} MB.\n")
+    start = probe()
+    stack = list(lines)  # push all in a single call
+    end = probe()
+    results.append(("Stack creation (push all)", start, end))
 
     # (C) QUEUE (using collections.deque for efficiency)
+    start = probe()
+    queue = deque(lines)  # enqueue all in a single call
+    end = probe()
+    results.append(("Queue creation (enqueue all)", start, end))
+
+    return hashtable, stack, queue
+
+def modify_structures(hashtable, stack, queue, probe, results):
+    """Removes and then adds 10 items in each structure, recording (label, probe() before, probe() after)."""
+    # Example: removing 10 items from each data structure
+    # (A) Stack removal (pop from the end)
+    start = probe()
+    for _ in range(10):
+        if stack:
+            stack.pop()
+    end = probe()
+    results.append(("Stack pop(10)", start, end))
+
+    # (B) Queue removal (popleft)
+    start = probe()
+    for _ in range(10):
+        if queue:
+            queue.popleft()
+    end = probe()
+    results.append(("Queue popleft(10)", start, end))
+
+    # (C) Hashtable removal
+    # We'll remove 10 items from the dictionary if we can (just some keys)
+    # For demonstration, we remove the first 10 keys of the dictionary.
+    start = probe()
+    to_remove = list(islice(hashtable, 10))
+    for key in to_remove:
+        if key in hashtable:
+            del hashtable[key]
+    end = probe()
+    results.append(("Hashtable removal of 10 items", start, end))
+
+    # Example: adding new items to each data structure
+    # We'll just create some dummy lines, e.g. ["new_file1", "new_file2", ...]
+    new_lines = [f"new_file{i}" for i in range(10)]
+
+    # (A) Stack insertion
+    start = probe()
+    stack.extend(new_lines)
+    end = probe()
+    results.append(("Stack push(10)", start, end))
+
+    # (B) Queue insertion
+    start = probe()
+    queue.extend(new_lines)
+    end = probe()
+    results.append(("Queue enqueue(10)", start, end))
+
+    # (C) Hashtable insertion
+    start = probe()
+    hashtable.update({line: i + 999999 for i, line in enumerate(new_lines)})  # Some arbitrary data
+    end = probe()
+    results.append(("Hashtable insertion of 10 new items", start, end))
+
+def main():
+    # 1. Read the file listing from text file
+    input_file = "listing.txt"
     
-    start_time = time.perf_counter()
-    start_mem = measure_memory()
-    
-    queue = deque()
-    for line in lines:
-        queue.append(line)  # enqueue
-    
-    end_time = time.perf_counter()
-    end_mem = measure_memory()
-    
-    print(f"Queue creation (enqueue all) took {(end_time - start_time):.6f} seconds.")
-    print(f"Memory used for queue: {end_mem - start_mem:.6f} MB.\n")
+    # Stream the file line by line (1 MiB read buffer), stripping each line only once
+    with open(input_file, "r", encoding="utf-8", errors="ignore", buffering=1 << 20) as f:
+        lines = [s for s in (line.strip() for line in f) if s]
+
+    # Print an overview
+    print(f"Total lines read from file: {len(lines)}")
+
+    # 2. Timing pass: build the structures with tracemalloc off, since tracing slows allocations
+    #    unevenly (the dict build far more than the list copy) and would skew the comparison.
+    #    The probe is passed in as an argument, so the measured sections only do a local lookup.
+    #    Readings are collected and printed at the end, keeping stdout writes away from the timed sections.
+    times = []
+    hashtable, stack, queue = build_structures(lines, time.perf_counter, times)
 
     # 3. Retrieve the names of the files in positions 1, 100, 1000, 5000, and last for each structure
     #    Note: We'll assume 1-based indexing as typically stated in tasks, so be mindful for 0-based Python indexing.
@@ -77,19 +133,25 @@ def main():
     # For a Python list used as a stack, we can do direct indexing, but that’s not typically how stacks are used.
     # We'll just show we *can* index them. 
     # If the requested position doesn't exist, handle it gracefully.
+    # All valid positions are fetched in a single C-level call with itemgetter.
+    valid = [pos for pos in positions if pos <= len(stack)]
+    values = itemgetter(*(pos - 1 for pos in valid))(stack) if valid else ()
+    stack_items = dict(zip(valid, values))
     for pos in positions:
-        if pos <= len(stack):
-            print(f"Stack position {pos}: {stack[pos-1]}")
+        if pos in stack_items:
+            print(f"Stack position {pos}: {stack_items[pos]}")
         else:
             print(f"Stack position {pos} out of range!")
     print()
 
     # Retrieve from Queue (again, direct indexing possible with a deque, but not as cheap for large indexes)
     # In real queue usage, you'd pop from the left or right. We'll just show indexing as an example.
-    queue_list = list(queue)  # Convert to list for direct indexing
+    # The deque is indexed directly (no copy to a list); the last element is read in O(1) via queue[-1].
     for pos in positions:
-        if pos <= len(queue_list):
-            print(f"Queue position {pos}: {queue_list[pos-1]}")
+        if pos == len(queue):
+            print(f"Queue position {pos}: {queue[-1]}")
+        elif pos < len(queue):
+            print(f"Queue position {pos}: {queue[pos-1]}")
         else:
             print(f"Queue position {pos} out of range!")
     print()
@@ -98,84 +160,39 @@ def main():
     # Hashtables typically don’t store in a specific "position" sense. We can do a naive approach:
     # e.g. just convert keys to a list and index. 
     # But this won't match the original line order unless we used an OrderedDict or just store lines in a list. 
-    # We'll demonstrate a direct approach:
-    hashtable_keys = list(hashtable.keys())
+    # We'll demonstrate a direct approach, walking the keys with islice instead of copying them all into a list
+    # (the last key is read in O(1) via reversed()):
     for pos in positions:
-        if pos <= len(hashtable_keys):
-            print(f"Hashtable position {pos}: {hashtable_keys[pos-1]}")
+        if pos == len(hashtable):
+            print(f"Hashtable position {pos}: {next(reversed(hashtable))}")
+        elif pos < len(hashtable):
+            print(f"Hashtable position {pos}: {next(islice(hashtable, pos-1, None))}")
         else:
             print(f"Hashtable position {pos} out of range!")
     print()
 
-    # 4. Measure & record execution time + memory used for removal and insertion
+    # 4. Measure & record execution time for removal and insertion (still with tracing off)
     #    The teacher indicated "perform the addition and removal of items". Let’s demonstrate a small example.
-
-    # Example: removing 10 items from each data structure, measuring time & memory
-    # (A) Stack removal (pop from the end)
-    start_time = time.perf_counter()
-    start_mem = measure_memory()
-
-
-    for _ in range(10):
-        if stack:
-            stack.pop()
-    end_time = time.perf_counter()
-    end_mem = measure_memory()
-    print(f"Stack pop(10) took {(end_time - start_time):.6f} seconds, memory change: {end_mem - start_mem:.6f} MB.")
-
-    # (B) Queue removal (popleft)
-    start_time = time.perf_counter()
-    start_mem = measure_memory()
-    for _ in range(10):
-        if queue:
-            queue.popleft()
-    end_time = time.perf_counter()
-    end_mem = measure_memory()
-    print(f"Queue popleft(10) took {(end_time - start_time):.6f} seconds, memory change: {end_mem - start_mem:.6f} MB.")
-
-    # (C) Hashtable removal
-    # We'll remove 10 items from the dictionary if we can (just some keys)
-    # For demonstration, we remove from the front of 'hashtable_keys'.
-    start_time = time.perf_counter()
-    start_mem = measure_memory()
-    to_remove = hashtable_keys[:10]
-    for key in to_remove:
-        if key in hashtable:
-            del hashtable[key]
-    end_time = time.perf_counter()
-    end_mem = measure_memory()
-    print(f"Hashtable removal of 10 items took {(end_time - start_time):.6f} seconds, memory change: {end_mem - start_mem:.6f} MB.\n")
-
-    # Example: adding new items to each data structure
-    # We'll just create some dummy lines, e.g. ["new_file1", "new_file2", ...]
-    new_lines = [f"new_file{i}" for i in range(10)]
-
-    # (A) Stack insertion
-    start_time = time.perf_counter()
-    start_mem = measure_memory()
-    for line in new_lines:
-        stack.append(line)
-    end_time = time.perf_counter()
-    end_mem = measure_memory()
-    print(f"Stack push(10) took {(end_time - start_time):.6f} seconds, memory change: {end_mem - start_mem:.6f} MB.")
-
-    # (B) Queue insertion
-    start_time = time.perf_counter()
-    start_mem = measure_memory()
-    for line in new_lines:
-        queue.append(line)
-    end_time = time.perf_counter()
-    end_mem = measure_memory()
-    print(f"Queue enqueue(10) took {(end_time - start_time):.6f} seconds, memory change: {end_mem - start_mem:.6f} MB.")
-
-    # (C) Hashtable insertion
-    start_time = time.perf_counter()
-    start_mem = measure_memory()
-    for i, line in enumerate(new_lines):
-        hashtable[line] = i + 999999  # Some arbitrary data
-    end_time = time.perf_counter()
-    end_mem = measure_memory()
-    print(f"Hashtable insertion of 10 new items took {(end_time - start_time):.6f} seconds, memory change: {end_mem - start_mem:.6f} MB.\n")
+    modify_structures(hashtable, stack, queue, time.perf_counter, times)
+
+    # 5. Memory pass: replay the same builds and operations on fresh structures with tracemalloc on,
+    #    so measure_memory() reports the allocation delta of each section without distorting the timings above.
+    del hashtable, stack, queue
+    mems = []
+    tracemalloc.start()
+    traced = build_structures(lines, measure_memory, mems)
+    modify_structures(*traced, measure_memory, mems)
+    tracemalloc.stop()
+    del traced
+
+    # 6. Report all timings and memory deltas collected above
+    print("Timing and memory results:")
+    for (label, start_time, end_time), (_, start_mem, end_mem) in zip(times, mems):
+        print(f"{label} took {(end_time - start_time):.6f} seconds, memory change: {end_mem - start_mem:.6f} MB.")
+
+    peak_rss = measure_peak_rss()
+    if peak_rss is not None:
+        print(f"\nPeak process memory (RSS): {peak_rss:.2f} MB.")
 
 if __name__ == "__main__":
     main()